@@ -1,7 +1,8 @@
 from django.contrib import admin
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from .models import (
-    ProjectTag, Project, UserProject, ProjectSubmission, ProjectAssessment
+    ProjectTag, Project, UserProject, ProjectSubmission, SubmissionArtifact, ProjectAssessment
 )
 
 @admin.register(ProjectTag)
@@ -130,11 +131,14 @@ class UserProjectAdmin(admin.ModelAdmin):
     search_fields = ('user__email', 'user__username', 'project__title', 'repository_url', 'live_url')
     readonly_fields = (
         'id', 'user', 'project', 'started_at', 'completed_at',
+        'submission_count', 'latest_submission_version',
         'created_at', 'updated_at'
     )
     fieldsets = (
         (None, {'fields': ('user', 'project')}),
-        (_('Status & Progress'), {'fields': ('status', 'started_at', 'completed_at')}),
+        (_('Status & Progress'), {'fields': (
+            'status', 'started_at', 'completed_at', 'submission_count', 'latest_submission_version'
+        )}),
         (_('User Provided Links'), {'fields': ('repository_url', 'live_url')}),
         (_('Timestamps'), {'fields': ('created_at', 'updated_at')}),
     )
@@ -151,9 +155,16 @@ class UserProjectAdmin(admin.ModelAdmin):
     user_email.short_description = _('User Email')
     user_email.admin_order_field = 'user__email'
 
-    def submission_count(self, obj):
-        return obj.submissions.count()
-    submission_count.short_description = _('Submissions')
+
+class SubmissionArtifactInline(admin.TabularInline):
+    model = SubmissionArtifact
+    extra = 0
+    fields = ('order', 'kind', 'url', 'title')
+    readonly_fields = ('order', 'kind', 'url', 'title')
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
 
 
 class ProjectAssessmentInline(admin.TabularInline): # Or StackedInline
@@ -192,15 +203,19 @@ class ProjectSubmissionAdmin(admin.ModelAdmin):
     list_display = (
         'user_project_identifier', 'submission_version', 'submitted_at', 'assessment_status_display'
     )
-    list_filter = ('user_project__project__title', 'user_project__user__email', 'submitted_at')
+    list_filter = ('is_assessed', 'user_project__project__title', 'user_project__user__email', 'submitted_at')
     search_fields = (
         'user_project__user__email', 'user_project__project__title', 'submission_notes'
     )
     readonly_fields = ('id', 'user_project', 'submitted_at', 'submission_version', 'submission_artifacts')
     fields = ('user_project', 'submitted_at', 'submission_version', 'submission_notes', 'submission_artifacts')
-    inlines = [ProjectAssessmentInline] # Show the assessment directly on the submission
+    inlines = [SubmissionArtifactInline, ProjectAssessmentInline] # Show the artifacts and assessment directly on the submission
     list_select_related = ('user_project__user', 'user_project__project', 'assessment')
 
+    def get_queryset(self, request):
+        # The list only shows pass/fail, so don't pull each assessment's feedback blobs
+        return super().get_queryset(request).defer('assessment__detailed_feedback', 'assessment__feedback_summary')
+
     def user_project_identifier(self, obj):
         return f"{obj.user_project.user.email} - {obj.user_project.project.title}"
     user_project_identifier.short_description = _('User Project')
@@ -215,6 +230,15 @@ class ProjectSubmissionAdmin(admin.ModelAdmin):
         return _("Pending Assessment")
     assessment_status_display.short_description = _('Assessment Status')
 
+    def delete_queryset(self, request, queryset):
+        # Bulk deletes skip ProjectSubmission.delete(), so recompute the affected UserProjects' stats here,
+        # locking them first (in primary key order) like the model's own writers do
+        with transaction.atomic():
+            user_project_ids = set(queryset.values_list('user_project_id', flat=True))
+            list(UserProject.objects.select_for_update().filter(pk__in=user_project_ids).order_by('pk').values_list('pk', flat=True))
+            super().delete_queryset(request, queryset)
+            UserProject.refresh_submission_stats(user_project_ids)
+
 
 @admin.register(ProjectAssessment)
 class ProjectAssessmentAdmin(admin.ModelAdmin):
@@ -263,5 +287,11 @@ class ProjectAssessmentAdmin(admin.ModelAdmin):
         return _("N/A")
     assessed_by_display.short_description = _('Assessed By')
 
+    def delete_queryset(self, request, queryset):
+        # Bulk deletes skip ProjectAssessment.delete(), so reopen the submissions here
+        submission_ids = list(queryset.values_list('submission_id', flat=True))
+        super().delete_queryset(request, queryset)
+        ProjectSubmission.objects.filter(pk__in=submission_ids).update(is_assessed=False)
+
     # Potentially add an action to trigger re-assessment if needed
 
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from apps.projects.models import ProjectCatalogEntry
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the precomputed project catalog (ProjectCatalogEntry).
+    Intended to be run periodically, e.g. from cron or Cloud Scheduler.
+    """
+    help = 'Rebuilds the precomputed published-projects catalog.'
+
+    def handle(self, *args, **options):
+        count = ProjectCatalogEntry.refresh()
+        self.stdout.write(self.style.SUCCESS(f'Refreshed project catalog with {count} entries.'))
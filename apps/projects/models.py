@@ -1,15 +1,63 @@
+import copy
+import os
+import time
 import uuid
-from django.db import models
+from collections import defaultdict
+from urllib.parse import unquote, urlsplit
+from django.db import models, transaction
+from django.db.models import Avg, Count, F, Func, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
+from django.dispatch import receiver
 from django.conf import settings
+from django.utils import timezone
+from django.utils.encoding import force_str
+from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+def uuid7():
+    """
+    Returns a time-ordered UUID (version 7, RFC 9562): a 48-bit Unix millisecond timestamp followed by random bits.
+    Used for primary keys so new rows are appended to the index instead of scattered across it like uuid4.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76) # Version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62) # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+class JSONStringArray(Func):
+    """
+    Index expression for a JSON array of strings. On MySQL it becomes a multi-valued index key part,
+    which JSON_CONTAINS (the `__contains` lookup) and MEMBER OF can use; other backends index the column as-is.
+    """
+    def __init__(self, expression, max_length, **extra):
+        super().__init__(expression, max_length=max_length, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return compiler.compile(self.source_expressions[0])
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection, template='CAST(%(expressions)s AS CHAR(%(max_length)s) ARRAY)', **extra_context
+        )
+
+
 # Choices for Project Difficulty
-PROJECT_DIFFICULTY_CHOICES = [
-    ('beginner', _('Beginner')),
-    ('intermediate', _('Intermediate')),
-    ('advanced', _('Advanced')),
-    ('expert', _('Expert')),
+class ProjectDifficulty(models.TextChoices):
+    BEGINNER = 'beginner', _('Beginner')
+    INTERMEDIATE = 'intermediate', _('Intermediate')
+    ADVANCED = 'advanced', _('Advanced')
+    EXPERT = 'expert', _('Expert')
+
+PROJECT_DIFFICULTY_CHOICES = ProjectDifficulty.choices # Kept for existing imports
+
+# Choices for SubmissionArtifact Kind
+SUBMISSION_ARTIFACT_KIND_CHOICES = [
+    ('repo', _('Repository')),
+    ('live', _('Live Demo')),
+    ('file', _('File')),
 ]
 
 # Choices for UserProject Status
@@ -23,11 +71,17 @@ USER_PROJECT_STATUS_CHOICES = [
     ('archived', _('Archived')), # User archived it
 ]
 
+# Precomputed label lookups. Django's get_FOO_display() rebuilds a dict from the field's choices on every call,
+# which adds up when admin lists, serializers and __str__ render many rows.
+PROJECT_DIFFICULTY_MAP = dict(PROJECT_DIFFICULTY_CHOICES)
+USER_PROJECT_STATUS_MAP = dict(USER_PROJECT_STATUS_CHOICES)
+SUBMISSION_ARTIFACT_KIND_MAP = dict(SUBMISSION_ARTIFACT_KIND_CHOICES)
+
 class ProjectTag(models.Model):
     """
     Tags for categorizing projects (e.g., Python, JavaScript, Machine Learning, Web App).
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=50, unique=True, verbose_name=_('Tag Name'))
     slug = models.SlugField(max_length=60, unique=True, verbose_name=_('Slug'))
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_('Created At'))
@@ -40,19 +94,46 @@ class ProjectTag(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_slug = instance.__dict__.get('slug')
+        return instance
+
+    def save(self, *args, **kwargs):
+        slug_changed = not self._state.adding and self.slug != getattr(self, '_loaded_slug', None)
+        super().save(*args, **kwargs)
+        if slug_changed: # Refresh the denormalized copies on its projects
+            rebuild_project_tag_slugs(self.projects.values_list('pk', flat=True))
+        self._loaded_slug = self.slug
+
+class ProjectQuerySet(models.QuerySet):
+    LIST_FIELDS = (
+        'id', 'title', 'slug', 'description', 'difficulty_level', 'estimated_duration_hours',
+        'is_published', 'ai_generated', 'created_by', 'created_at', 'updated_at',
+    )
+
+    def for_listing(self):
+        """
+        Everything a project list renders in a fixed number of queries: the creator joined, tags prefetched
+        and only the summary columns loaded.
+        """
+        return self.select_related('created_by').prefetch_related('technologies_used').only(*self.LIST_FIELDS)
+
+
 class Project(models.Model):
     """
     Defines a project template or a specific project challenge.
     This can be created by admins/instructors or generated by AI.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.CharField(max_length=200, verbose_name=_('Project Title'))
     slug = models.SlugField(max_length=220, unique=True, verbose_name=_('Slug'))
     description = models.TextField(verbose_name=_('Project Description'))
     difficulty_level = models.CharField(
         max_length=20,
-        choices=PROJECT_DIFFICULTY_CHOICES,
-        default='intermediate',
+        choices=ProjectDifficulty.choices,
+        default=ProjectDifficulty.INTERMEDIATE,
         verbose_name=_('Difficulty Level')
     )
     estimated_duration_hours = models.PositiveIntegerField(
@@ -60,6 +141,8 @@ class Project(models.Model):
         verbose_name=_('Estimated Duration (Hours)'),
         help_text=_("Estimated time a user might spend on this project.")
     )
+    # learning_outcomes/prerequisites stay JSON: MySQL has no native array type (ArrayField is PostgreSQL-only),
+    # and existing data/API clients also use object shapes. Filter lists with __contains=[...] (JSON_CONTAINS).
     learning_outcomes = models.JSONField(
         default=list, blank=True,
         verbose_name=_('Learning Outcomes'),
@@ -76,6 +159,9 @@ class Project(models.Model):
         related_name='projects',
         verbose_name=_('Technologies/Tags')
     )
+    # Denormalized copy of the technologies_used slugs, so "has tags X and Y" is one indexed JSON_CONTAINS
+    # instead of joins + GROUP BY (kept in sync by the m2m_changed receiver below)
+    tag_slugs = models.JSONField(default=list, blank=True, editable=False, verbose_name=_('Tag Slugs'))
     # Detailed instructions, requirements, user stories, etc.
     guidelines = models.JSONField(
         default=dict, blank=True,
@@ -105,19 +191,95 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_('Created At'))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_('Updated At'))
 
+    objects = ProjectQuerySet.as_manager() # Full rows; list views use objects.for_listing()
+
     class Meta:
         verbose_name = _('Project Definition')
         verbose_name_plural = _('Project Definitions')
         ordering = ['-created_at', 'title']
+        indexes = [
+            models.Index(fields=['is_published', '-created_at'], name='project_published_created_idx'),
+            models.Index(fields=['difficulty_level', 'is_published'], name='project_difficulty_pub_idx'),
+            models.Index(JSONStringArray('tag_slugs', max_length=60), name='project_tag_slugs_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
+    def get_difficulty_level_display(self):
+        return force_str(PROJECT_DIFFICULTY_MAP.get(self.difficulty_level, self.difficulty_level), strings_only=True)
+
+    @classmethod
+    def bulk_ingest_ai(cls, prompts, titles, descriptions, tags_by_slug=None):
+        """
+        Stores a batch of AI-generated (unpublished) project definitions with a handful of bulk INSERTs.
+        `tags_by_slug` maps a project slug to the tag names to attach. Projects whose slug already exists
+        are skipped, and missing tags are created. Returns the newly created projects.
+        """
+        tags_by_slug = tags_by_slug or {}
+        items = [(prompt, title[:200], slugify(title)[:220], description) for prompt, title, description in zip(prompts, titles, descriptions)]
+        tag_names = {name for _prompt, _title, slug, _description in items for name in tags_by_slug.get(slug, [])}
+        with transaction.atomic():
+            ProjectTag.objects.bulk_create(
+                [ProjectTag(name=name[:50], slug=slugify(name)[:60]) for name in tag_names],
+                batch_size=500, ignore_conflicts=True
+            )
+            # Match on name or slug: an existing tag may share the name but use a different slug
+            tags = ProjectTag.objects.filter(
+                Q(name__in=[name[:50] for name in tag_names]) | Q(slug__in=[slugify(name)[:60] for name in tag_names])
+            )
+            tags_by_key = {}
+            for tag in tags:
+                tags_by_key[tag.name] = tags_by_key[tag.slug] = tag
+
+            project_tags = {}
+            rows = []
+            for prompt, title, slug, description in items:
+                project_tags[slug] = {
+                    tags_by_key.get(name[:50]) or tags_by_key[slugify(name)[:60]] for name in tags_by_slug.get(slug, [])
+                }
+                rows.append(cls(
+                    title=title, slug=slug, description=description,
+                    ai_generated=True, ai_generation_prompt=prompt, is_published=False,
+                    tag_slugs=sorted(tag.slug for tag in project_tags[slug]), # m2m_changed won't fire for bulk inserts
+                ))
+            cls.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+
+            # Primary keys are generated client-side, so they identify exactly the rows that were inserted
+            created_ids = set(cls.objects.filter(pk__in=[row.pk for row in rows]).values_list('pk', flat=True))
+            created = [row for row in rows if row.pk in created_ids]
+            Through = cls.technologies_used.through
+            Through.objects.bulk_create(
+                [Through(project_id=project.pk, projecttag_id=tag.pk) for project in created for tag in project_tags[project.slug]],
+                batch_size=500, ignore_conflicts=True
+            )
+        return created
+
+    def save(self, *args, **kwargs):
+        is_new = self._state.adding
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if not is_new and (update_fields is None or 'title' in update_fields):
+            # Keep the title copy on UserProject in sync (used by its __str__)
+            UserProject.objects.filter(project_id=self.pk).exclude(project_title=self.title).update(project_title=self.title)
+
+class UserProjectQuerySet(models.QuerySet):
+    def for_listing(self):
+        """
+        Joins the user and project in the same query and loads only the columns a UserProject list renders.
+        """
+        return self.select_related('user', 'project').only(
+            'id', 'status', 'started_at', 'completed_at', 'updated_at', 'submission_count',
+            'latest_submission_version', 'user_email', 'project_title',
+            'user__id', 'user__email', 'project__id', 'project__title', 'project__slug', 'project__difficulty_level',
+        )
+
+
 class UserProject(models.Model):
     """
     Represents an instance of a Project assigned to or undertaken by a user.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -144,34 +306,132 @@ class UserProject(models.Model):
     repository_url = models.URLField(blank=True, null=True, verbose_name=_('Project Repository URL (e.g., GitHub)'))
     live_url = models.URLField(blank=True, null=True, verbose_name=_('Live Project URL (e.g., deployed app)'))
 
+    # Denormalized display fields so __str__ doesn't query the user/project (set on creation)
+    user_email = models.EmailField(blank=True, editable=False, verbose_name=_('User Email'))
+    project_title = models.CharField(max_length=200, blank=True, editable=False, verbose_name=_('Project Title'))
+
+    # True for live instances, NULL once archived; backs the uniq_active_userproject constraint (kept in step by save())
+    is_active = models.BooleanField(null=True, default=True, editable=False, verbose_name=_('Is Active'))
+
+    # Denormalized submission stats (maintained by ProjectSubmission.save()/delete(), see refresh_submission_stats())
+    submission_count = models.PositiveIntegerField(default=0, editable=False, verbose_name=_('Submission Count'))
+    latest_submission_version = models.PositiveIntegerField(default=0, editable=False, verbose_name=_('Latest Submission Version'))
+
     # Could link to a specific course enrollment if project is part of a course
     # enrollment = models.ForeignKey('courses.Enrollment', null=True, blank=True, on_delete=models.SET_NULL)
 
     created_at = models.DateTimeField(auto_now_add=True, verbose_name=_('Assigned/Created At'))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_('Last Updated At'))
 
+    objects = UserProjectQuerySet.as_manager()
+
+    SUBMISSION_STATS_FIELDS = ('submission_count', 'latest_submission_version')
+
     class Meta:
         verbose_name = _('User Project Instance')
         verbose_name_plural = _('User Project Instances')
-        unique_together = [['user', 'project']] # User can only have one instance of a specific project definition
         ordering = ['-updated_at', '-created_at']
+        constraints = [
+            # A user can only have one non-archived instance of a specific project definition.
+            # MySQL has no partial unique indexes, so is_active is NULL for archived rows
+            # (NULLs never collide in a unique index), letting archived instances coexist with a new one.
+            models.UniqueConstraint(fields=['user', 'project', 'is_active'], name='uniq_active_userproject'),
+        ]
+        indexes = [
+            models.Index(fields=['user', 'status'], name='userproject_user_status_idx'),
+            models.Index(fields=['user', '-updated_at'], name='userproject_user_updated_idx'),
+            models.Index(fields=['project', 'status'], name='userproject_project_status_idx'),
+        ]
 
     def __str__(self):
-        return f"{self.user.email}'s work on '{self.project.title}' ({self.get_status_display()})"
+        # Rows created before the display fields existed fall back to the relations until backfilled
+        user_email = self.user_email or self.user.email
+        project_title = self.project_title or self.project.title
+        return f"{user_email}'s work on '{project_title}' ({self.get_status_display()})"
+
+    def get_status_display(self):
+        return force_str(USER_PROJECT_STATUS_MAP.get(self.status, self.status), strings_only=True)
+
+    @classmethod
+    def backfill_display_fields(cls):
+        """
+        Fills user_email/project_title on rows created before those fields existed, using two UPDATEs.
+        """
+        from django.contrib.auth import get_user_model
+        cls.objects.filter(user_email='').update(
+            user_email=Subquery(get_user_model().objects.filter(pk=OuterRef('user_id')).values('email')[:1])
+        )
+        cls.objects.filter(project_title='').update(
+            project_title=Subquery(Project.objects.filter(pk=OuterRef('project_id')).values('title')[:1])
+        )
+
+    @classmethod
+    def backfill_is_active(cls):
+        """
+        Clears is_active on archived rows created before the field existed (they default to True).
+        """
+        return cls.objects.filter(status='archived', is_active=True).update(is_active=None)
+
+    @classmethod
+    def refresh_submission_stats(cls, pks=None):
+        """
+        Recomputes submission_count/latest_submission_version from the submissions table in one UPDATE,
+        for the given UserProjects or (pks=None) all of them, e.g. to backfill rows created before these
+        fields existed. Run ProjectSubmission.renumber_versions() first on legacy data.
+        """
+        submissions = ProjectSubmission.objects.filter(user_project_id=OuterRef('pk')).order_by().values('user_project_id')
+        queryset = cls.objects.all() if pks is None else cls.objects.filter(pk__in=pks)
+        return queryset.update(
+            submission_count=Coalesce(Subquery(submissions.annotate(count=Count('pk')).values('count')), 0),
+            latest_submission_version=Coalesce(
+                Subquery(submissions.annotate(latest=Max('submission_version')).values('latest')), 0
+            ),
+        )
+
+    def clean(self):
+        super().clean()
+        self.is_active = None if self.status == 'archived' else True # So validate_constraints() sees the saved value
 
     def save(self, *args, **kwargs):
+        self.is_active = None if self.status == 'archived' else True
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'status' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'is_active'}
+        elif update_fields is None and not self._state.adding:
+            # The submission stats are only written by queryset UPDATEs; a full save from a stale
+            # instance must not put old values back
+            deferred_fields = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.SUBMISSION_STATS_FIELDS
+                and field.attname not in deferred_fields
+            ]
+        if self._state.adding:
+            self.user_email = self.user_email or self.user.email
+            self.project_title = self.project_title or self.project.title
+        # Status timestamps are derived here, the single place for save()-based writes. Status changes
+        # made with queryset .update() (ProjectAssessment.save(), bulk_finalize()) set them explicitly.
         if self.status == 'in_progress' and not self.started_at:
             self.started_at = timezone.now()
-        # completed_at is set when assessment passes
+        elif self.status == 'completed' and not self.completed_at: # e.g. marked completed by an admin
+            self.completed_at = timezone.now()
         super().save(*args, **kwargs)
 
 
+class ProjectSubmissionQuerySet(models.QuerySet):
+    def for_listing(self):
+        """
+        Joins the owning user/project (used by serializers and __str__) and prefetches the artifacts.
+        """
+        return self.select_related('user_project__project', 'user_project__user').prefetch_related('artifacts')
+
+
 class ProjectSubmission(models.Model):
     """
     Represents a user's submission for a given UserProject instance.
     A UserProject can have multiple submissions if re-attempts are allowed.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user_project = models.ForeignKey(
         UserProject,
         on_delete=models.CASCADE,
@@ -181,48 +441,210 @@ class ProjectSubmission(models.Model):
     submitted_at = models.DateTimeField(auto_now_add=True, verbose_name=_('Submitted At'))
     submission_notes = models.TextField(blank=True, null=True, verbose_name=_('Submission Notes by User'))
     
-    # Storing links to files or code. For actual file uploads, use FileField and configure storage.
-    # For simplicity, JSONField can store links to GitHub repo, zip files, etc.
+    # Deprecated: kept as the write format for one release. Whenever it is saved with new links, they are
+    # normalized into SubmissionArtifact rows (see `artifacts`), which readers should use instead.
     submission_artifacts = models.JSONField(
         default=dict, blank=True,
-        verbose_name=_('Submission Artifacts'),
+        verbose_name=_('Submission Artifacts (Deprecated)'),
         help_text=_("e.g., {'repository_url': '...', 'live_demo_url': '...', 'file_links': ['...']}. UserProject URLs can be primary.")
     )
     # If you want to track submission versions
     submission_version = models.PositiveIntegerField(default=1, verbose_name=_('Submission Version'))
+    # Denormalized so the pending-assessment queue can be served from an index (kept in sync by ProjectAssessment)
+    is_assessed = models.BooleanField(default=False, editable=False, verbose_name=_('Is Assessed'))
+
+    objects = ProjectSubmissionQuerySet.as_manager()
 
 
     class Meta:
         verbose_name = _('Project Submission')
         verbose_name_plural = _('Project Submissions')
         ordering = ['user_project', '-submitted_at'] # Latest submission first for a project
+        indexes = [
+            # Not unique: rows created before versions were numbered all hold version 1 (see renumber_versions())
+            models.Index(fields=['user_project', 'submission_version'], name='psub_userproject_version_idx'),
+            models.Index(fields=['user_project', '-submitted_at'], name='psub_userproject_submitted_idx'),
+            models.Index(fields=['is_assessed', '-submitted_at'], name='psub_pending_idx'),
+        ]
 
     def __str__(self):
-        return f"Submission for '{self.user_project.project.title}' by {self.user_project.user.email} at {self.submitted_at.strftime('%Y-%m-%d %H:%M')}"
+        user_project = self.user_project
+        project_title = user_project.project_title or user_project.project.title
+        user_email = user_project.user_email or user_project.user.email
+        return f"Submission for '{project_title}' by {user_email} at {self.submitted_at.strftime('%Y-%m-%d %H:%M')}"
+
+    @classmethod
+    def renumber_versions(cls, batch_size=500):
+        """
+        Numbers each UserProject's submissions 1..n by submission time. Submissions created before
+        versioning worked all hold version 1; run this before relying on submission_version.
+        Returns the number of rows changed.
+        """
+        changed = []
+        version, last_user_project_id = 0, None
+        for pk, user_project_id, submission_version in cls.objects.order_by(
+            'user_project_id', 'submitted_at', 'pk'
+        ).values_list('pk', 'user_project_id', 'submission_version').iterator():
+            version = version + 1 if user_project_id == last_user_project_id else 1
+            last_user_project_id = user_project_id
+            if submission_version != version:
+                changed.append(cls(pk=pk, submission_version=version))
+        cls.objects.bulk_update(changed, ['submission_version'], batch_size=batch_size)
+        return len(changed)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so save() only rebuilds the artifact rows when the links actually change
+        instance._loaded_submission_artifacts = copy.deepcopy(instance.__dict__.get('submission_artifacts'))
+        return instance
 
     def save(self, *args, **kwargs):
-        if not self.pk: # On first save (creation)
-            # Update UserProject status to 'submitted'
-            self.user_project.status = 'submitted'
-            self.user_project.save(update_fields=['status', 'updated_at'])
-            # Set submission version
-            latest_submission = ProjectSubmission.objects.filter(user_project=self.user_project).order_by('-submission_version').first()
-            if latest_submission:
-                self.submission_version = latest_submission.submission_version + 1
-        super().save(*args, **kwargs)
+        if not self._state.adding:
+            update_fields = kwargs.get('update_fields')
+            artifacts_changed = (
+                (update_fields is None or 'submission_artifacts' in update_fields)
+                and 'submission_artifacts' not in self.get_deferred_fields()
+                and self.submission_artifacts != getattr(self, '_loaded_submission_artifacts', None)
+            )
+            if not artifacts_changed:
+                super().save(*args, **kwargs)
+                return
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+                self.artifacts.all().delete()
+                SubmissionArtifact.objects.bulk_create(SubmissionArtifact.build_from_json(self))
+            self._loaded_submission_artifacts = copy.deepcopy(self.submission_artifacts)
+            getattr(self, '_prefetched_objects_cache', {}).pop('artifacts', None)
+            return
+        # On first save (creation); pk is already set by the UUID default
+        latest_version = ProjectSubmission.objects.filter(
+            user_project_id=OuterRef('pk')
+        ).order_by('-submission_version').values('submission_version')[:1] # Served by the (user_project, submission_version) index
+        with transaction.atomic():
+            # A single UPDATE marks the UserProject as 'submitted' and bumps its denormalized stats.
+            # It also row-locks the UserProject until commit (no separate SELECT ... FOR UPDATE needed),
+            # so concurrent submissions and assessments of this UserProject are serialized.
+            UserProject.objects.filter(pk=self.user_project_id).update(
+                status='submitted', is_active=True,
+                submission_count=F('submission_count') + 1,
+                latest_submission_version=Coalesce(Subquery(latest_version), 0) + 1,
+                updated_at=timezone.now(),
+            )
+            submission_count, self.submission_version = UserProject.objects.filter(
+                pk=self.user_project_id
+            ).values_list('submission_count', 'latest_submission_version').get()
+            if ProjectSubmission.user_project.is_cached(self): # Keep the caller's instance in step with the row
+                self.user_project.status, self.user_project.is_active = 'submitted', True
+                self.user_project.submission_count = submission_count
+                self.user_project.latest_submission_version = self.submission_version
+            super().save(*args, **kwargs)
+            artifacts = SubmissionArtifact.build_from_json(self)
+            if artifacts:
+                SubmissionArtifact.objects.bulk_create(artifacts)
+        self._loaded_submission_artifacts = copy.deepcopy(self.submission_artifacts)
+
+    def delete(self, *args, **kwargs):
+        # Keep the UserProject's submission stats in step (bulk deletes call refresh_submission_stats() themselves).
+        # Lock the UserProject before touching the submission, the order every other writer uses.
+        with transaction.atomic():
+            UserProject.objects.select_for_update().filter(pk=self.user_project_id).exists()
+            result = super().delete(*args, **kwargs)
+            UserProject.refresh_submission_stats([self.user_project_id])
+        return result
+
+
+class SubmissionArtifact(models.Model):
+    """
+    A single link (repository, live demo or file) attached to a ProjectSubmission.
+    Narrow rows let readers fetch just the links they need instead of the whole JSON blob.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    submission = models.ForeignKey(
+        ProjectSubmission,
+        on_delete=models.CASCADE,
+        related_name='artifacts',
+        verbose_name=_('Project Submission')
+    )
+    kind = models.CharField(max_length=10, choices=SUBMISSION_ARTIFACT_KIND_CHOICES, verbose_name=_('Kind'))
+    url = models.TextField(verbose_name=_('URL')) # Signed storage URLs easily exceed any VARCHAR limit we'd pick
+    title = models.CharField(max_length=200, blank=True, verbose_name=_('Title'))
+    order = models.PositiveIntegerField(default=0, verbose_name=_('Display Order'))
+
+    class Meta:
+        verbose_name = _('Submission Artifact')
+        verbose_name_plural = _('Submission Artifacts')
+        ordering = ['submission', 'order']
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.url}"
+
+    @classmethod
+    def build_from_json(cls, submission):
+        """
+        Returns unsaved artifacts for the links in `submission.submission_artifacts`.
+        """
+        data = submission.submission_artifacts
+        if not isinstance(data, dict):
+            return []
+        links = [('repo', data.get('repository_url')), ('live', data.get('live_demo_url'))]
+        file_links = data.get('file_links')
+        if isinstance(file_links, list):
+            links.extend(('file', url) for url in file_links)
+        links = [(kind, url) for kind, url in links if isinstance(url, str) and url]
+        return [
+            cls(submission=submission, kind=kind, url=url, title=cls.title_for(kind, url), order=order)
+            for order, (kind, url) in enumerate(links)
+        ]
+
+    @staticmethod
+    def title_for(kind, url):
+        if kind == 'file': # The file name, without any query string (e.g. a signed URL's signature)
+            name = unquote(urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1])
+            if name:
+                return name[:200]
+        return force_str(SUBMISSION_ARTIFACT_KIND_MAP[kind])
+
+    @classmethod
+    def backfill(cls, batch_size=500):
+        """
+        Creates artifact rows for submissions saved before this table existed (those with none yet),
+        walking the submissions in primary key batches. Returns the number of artifacts created.
+        """
+        created, last_pk = 0, None
+        while True:
+            submissions = ProjectSubmission.objects.filter(artifacts__isnull=True).order_by('pk')
+            if last_pk is not None:
+                submissions = submissions.filter(pk__gt=last_pk)
+            batch = list(submissions.only('pk', 'submission_artifacts')[:batch_size])
+            if not batch:
+                return created
+            last_pk = batch[-1].pk
+            artifacts = [artifact for submission in batch for artifact in cls.build_from_json(submission)]
+            cls.objects.bulk_create(artifacts, batch_size=batch_size)
+            created += len(artifacts)
 
 
 class ProjectAssessment(models.Model):
     """
     Stores the assessment results for a ProjectSubmission, typically done by an AI agent.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     submission = models.OneToOneField( # Each submission has one primary assessment
         ProjectSubmission,
         on_delete=models.CASCADE,
         related_name='assessment',
         verbose_name=_('Project Submission')
     )
+    # Denormalized from submission.user_project so status updates don't need to walk the submission.
+    # Set by save(); rows persisted with bulk_create() get it from bulk_finalize(). Null until then.
+    user_project = models.ForeignKey(
+        UserProject,
+        on_delete=models.CASCADE,
+        null=True, blank=True, editable=False,
+        related_name='assessments',
+        verbose_name=_('User Project Instance')
+    )
     assessed_by_ai = models.BooleanField(default=True, verbose_name=_('Assessed by AI Agent'))
     assessor_ai_agent_name = models.CharField(max_length=100, blank=True, null=True, verbose_name=_('AI Agent Name/Version'))
     # If manual assessment is possible
@@ -253,22 +675,193 @@ class ProjectAssessment(models.Model):
         verbose_name = _('Project Assessment')
         verbose_name_plural = _('Project Assessments')
         ordering = ['-assessed_at']
+        indexes = [
+            models.Index(fields=['submission', 'passed'], name='passess_submission_passed_idx'),
+        ]
 
     def __str__(self):
         status = "Passed" if self.passed else "Failed"
-        return f"Assessment for '{self.submission.user_project.project.title}' (Score: {self.score or 'N/A'} - {status})"
+        user_project = self.user_project if self.user_project_id else self.submission.user_project
+        project_title = user_project.project_title or user_project.project.title
+        return f"Assessment for '{project_title}' (Score: {self.score or 'N/A'} - {status})"
+
+    @classmethod
+    def bulk_finalize(cls, assessments):
+        """
+        Applies the UserProject status side-effects of many assessments at once.
+        Call this after persisting assessments with bulk_create()/bulk_update(), which skip save().
+        """
+        # Assessments persisted with bulk_create() skip save(), so their user_project may still be unset.
+        # The versions pick the outcome when a batch holds several assessments of one UserProject.
+        submissions = {
+            pk: (user_project_id, version) for pk, user_project_id, version in ProjectSubmission.objects.filter(
+                pk__in=[a.submission_id for a in assessments]
+            ).values_list('pk', 'user_project_id', 'submission_version')
+        }
+        latest = {} # user_project_id -> (submission_version, passed) of its newest assessed submission
+        for assessment in assessments:
+            if assessment.submission_id not in submissions: # Submission was deleted in the meantime
+                continue
+            user_project_id, version = submissions[assessment.submission_id]
+            if user_project_id not in latest or version >= latest[user_project_id][0]:
+                latest[user_project_id] = (version, assessment.passed)
+        passed_ids = {pk for pk, (_version, passed) in latest.items() if passed}
+        failed_ids = set(latest) - passed_ids
+        now = timezone.now()
+        with transaction.atomic():
+            # Lock the UserProjects first and in primary key order, like save() and ProjectSubmission.save(),
+            # so concurrent finalizers and single assessments can't deadlock on InnoDB row locks
+            if latest:
+                list(UserProject.objects.select_for_update().filter(pk__in=latest).order_by('pk').values_list('pk', flat=True))
+            missing_user_project = [a for a in assessments if a.user_project_id is None and a.submission_id in submissions]
+            if missing_user_project:
+                cls.objects.filter(pk__in=[a.pk for a in missing_user_project], user_project__isnull=True).update(
+                    user_project=Subquery(
+                        ProjectSubmission.objects.filter(pk=OuterRef('submission_id')).values('user_project_id')[:1]
+                    )
+                )
+                for assessment in missing_user_project:
+                    assessment.user_project_id = submissions[assessment.submission_id][0]
+            ProjectSubmission.objects.filter(pk__in=[a.submission_id for a in assessments]).update(is_assessed=True)
+            if passed_ids:
+                UserProject.objects.filter(pk__in=passed_ids).update(status='completed', is_active=True, completed_at=now, updated_at=now)
+            if failed_ids:
+                UserProject.objects.filter(pk__in=failed_ids).update(status='failed', is_active=True, updated_at=now)
 
     def save(self, *args, **kwargs):
         is_new = self._state.adding
-        super().save(*args, **kwargs)
-        if is_new or 'passed' in kwargs.get('update_fields', []): # If assessment is new or 'passed' status changes
-            # Update UserProject status based on assessment
-            user_project = self.submission.user_project
-            if self.passed:
-                user_project.status = 'completed'
-                user_project.completed_at = timezone.now()
-            else:
-                user_project.status = 'failed' # Or 'needs_revision' if you have such a state
-                # AI Tutor trigger logic would be handled in the view/service that calls the AI
-                # and creates this assessment. The 'ai_tutor_trigger_reason' can be set in detailed_feedback.
-            user_project.save(update_fields=['status', 'completed_at', 'updated_at'])
+        update_user_project = is_new or 'passed' in (kwargs.get('update_fields') or []) # New assessment or 'passed' changed
+        if self.user_project_id is None:
+            self.user_project_id = self.submission.user_project_id
+        user_project_id = self.user_project_id
+        with transaction.atomic():
+            if update_user_project:
+                # Lock the UserProject before writing, the same order ProjectSubmission.save() uses,
+                # so a concurrent resubmission and this assessment are applied one after the other.
+                UserProject.objects.select_for_update().filter(pk=user_project_id).exists()
+            super().save(*args, **kwargs)
+            if is_new:
+                ProjectSubmission.objects.filter(pk=self.submission_id).update(is_assessed=True)
+            if update_user_project:
+                # Update UserProject status based on assessment, in a single UPDATE (no fetch + save)
+                now = timezone.now()
+                if self.passed:
+                    changes = {'status': 'completed', 'completed_at': now}
+                else:
+                    changes = {'status': 'failed'} # Or 'needs_revision' if you have such a state
+                    # AI Tutor trigger logic would be handled in the view/service that calls the AI
+                    # and creates this assessment. The 'ai_tutor_trigger_reason' can be set in detailed_feedback.
+                UserProject.objects.filter(pk=user_project_id).update(is_active=True, updated_at=now, **changes)
+
+    def delete(self, *args, **kwargs):
+        # Deliberately not a post_delete signal: with no delete listeners, Django can remove assessments
+        # in a single DELETE when a ProjectSubmission or UserProject cascade reaches them, without loading rows.
+        result = super().delete(*args, **kwargs)
+        ProjectSubmission.objects.filter(pk=self.submission_id).update(is_assessed=False)
+        return result
+
+
+class ProjectCatalogEntry(models.Model):
+    """
+    Precomputed summary row for the published-projects catalog.
+    Stands in for a materialized view (MySQL has none); rebuilt by refresh(), so it may lag the live tables.
+    """
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='catalog_entry',
+        verbose_name=_('Project Definition')
+    )
+    title = models.CharField(max_length=200, verbose_name=_('Project Title'))
+    slug = models.SlugField(max_length=220, verbose_name=_('Slug'))
+    difficulty_level = models.CharField(max_length=20, choices=ProjectDifficulty.choices, verbose_name=_('Difficulty Level'))
+    tag_names = models.TextField(blank=True, verbose_name=_('Tag Names'))
+    attempt_count = models.PositiveIntegerField(default=0, verbose_name=_('Attempt Count'))
+    avg_score = models.FloatField(null=True, blank=True, verbose_name=_('Average Assessment Score'))
+    refreshed_at = models.DateTimeField(auto_now=True, verbose_name=_('Refreshed At'))
+
+    class Meta:
+        verbose_name = _('Project Catalog Entry')
+        verbose_name_plural = _('Project Catalog Entries')
+        ordering = ['title']
+
+    def __str__(self):
+        return self.title
+
+    def get_difficulty_level_display(self):
+        return force_str(PROJECT_DIFFICULTY_MAP.get(self.difficulty_level, self.difficulty_level), strings_only=True)
+
+    @classmethod
+    def refresh(cls):
+        """
+        Rebuilds the catalog from the live tables in one transaction. Run it on a schedule
+        (see the refresh_project_catalog management command). Returns the number of entries.
+        """
+        projects = Project.objects.for_listing().filter(is_published=True).annotate(
+            attempt_count=Count('user_instances', distinct=True),
+            avg_score=Avg('user_instances__submissions__assessment__score'),
+        )
+        entries = [
+            cls(
+                project=project,
+                title=project.title,
+                slug=project.slug,
+                difficulty_level=project.difficulty_level,
+                tag_names=', '.join(tag.name for tag in project.technologies_used.all()),
+                attempt_count=project.attempt_count,
+                avg_score=project.avg_score,
+            )
+            for project in projects
+        ]
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(entries, batch_size=500)
+        return len(entries)
+
+
+# --- Signals for denormalization ---
+
+def rebuild_project_tag_slugs(project_ids):
+    """
+    Recomputes Project.tag_slugs for the given projects from the technologies_used relation.
+    """
+    project_ids = list(project_ids)
+    if not project_ids:
+        return
+    slugs_by_project = defaultdict(list)
+    for project_id, slug in Project.technologies_used.through.objects.filter(
+        project_id__in=project_ids
+    ).values_list('project_id', 'projecttag__slug'):
+        slugs_by_project[project_id].append(slug)
+    Project.objects.bulk_update(
+        [Project(pk=project_id, tag_slugs=sorted(slugs_by_project[project_id])) for project_id in project_ids],
+        ['tag_slugs'], batch_size=500
+    )
+
+
+@receiver(m2m_changed, sender=Project.technologies_used.through)
+def sync_project_tag_slugs(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear': # instance is a ProjectTag; remember its projects before they're unlinked
+        instance._tag_slug_project_ids = list(instance.projects.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        rebuild_project_tag_slugs([instance.pk])
+        instance.tag_slugs = Project.objects.filter(pk=instance.pk).values_list('tag_slugs', flat=True).get()
+    elif action == 'post_clear':
+        rebuild_project_tag_slugs(getattr(instance, '_tag_slug_project_ids', []))
+    else:
+        rebuild_project_tag_slugs(pk_set)
+
+
+@receiver(pre_delete, sender=ProjectTag)
+def remember_tag_projects(sender, instance, **kwargs):
+    # The through rows are deleted without m2m_changed, so capture the affected projects first
+    instance._tag_slug_project_ids = list(instance.projects.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=ProjectTag)
+def remove_deleted_tag_slug(sender, instance, **kwargs):
+    rebuild_project_tag_slugs(getattr(instance, '_tag_slug_project_ids', []))
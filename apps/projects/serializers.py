@@ -1,11 +1,12 @@
 from rest_framework import serializers
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.utils.text import slugify # For generating slugs if needed
 
 from .models import (
-    ProjectTag, Project, UserProject, ProjectSubmission, ProjectAssessment,
-    USER_PROJECT_STATUS_CHOICES, PROJECT_DIFFICULTY_CHOICES
+    ProjectTag, Project, UserProject, ProjectSubmission, SubmissionArtifact, ProjectAssessment,
+    ProjectCatalogEntry, USER_PROJECT_STATUS_CHOICES, PROJECT_DIFFICULTY_CHOICES
 )
 # Assuming a simple user serializer might be needed from a shared app or users app
 # from apps.users.serializers import SimpleUserSerializer # Example import
@@ -42,6 +43,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
     technologies_used = ProjectTagSerializer(many=True, read_only=True)
     created_by = SimpleUserSerializer(read_only=True)
     difficulty_level_display = serializers.CharField(source='get_difficulty_level_display', read_only=True)
+    short_description = serializers.SerializerMethodField()
 
     class Meta:
         model = Project
@@ -60,6 +62,21 @@ class ProjectListSerializer(serializers.ModelSerializer):
         return obj.description[:150] + '...' if len(obj.description) > 150 else obj.description
 
 
+class ProjectCatalogEntrySerializer(serializers.ModelSerializer):
+    """
+    Serializer for the precomputed published-projects catalog.
+    """
+    difficulty_level_display = serializers.CharField(source='get_difficulty_level_display', read_only=True)
+
+    class Meta:
+        model = ProjectCatalogEntry
+        fields = [
+            'project_id', 'title', 'slug', 'difficulty_level', 'difficulty_level_display',
+            'tag_names', 'attempt_count', 'avg_score', 'refreshed_at'
+        ]
+        read_only_fields = fields
+
+
 class ProjectDetailSerializer(serializers.ModelSerializer):
     """
     Serializer for detailed view of a Project definition.
@@ -150,7 +167,8 @@ class UserProjectListSerializer(serializers.ModelSerializer):
         model = UserProject
         fields = [
             'id', 'user_email', 'project_id', 'project_title', 'project_slug', 'project_difficulty',
-            'status', 'status_display', 'started_at', 'completed_at', 'updated_at'
+            'status', 'status_display', 'submission_count', 'latest_submission_version',
+            'started_at', 'completed_at', 'updated_at'
         ]
 
 class UserProjectDetailSerializer(serializers.ModelSerializer):
@@ -172,9 +190,13 @@ class UserProjectDetailSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'user', 'project', 'project_id', 'status', 'status_display',
             'started_at', 'completed_at', 'repository_url', 'live_url',
+            'submission_count', 'latest_submission_version',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'user', 'project', 'started_at', 'completed_at', 'created_at', 'updated_at']
+        read_only_fields = [
+            'id', 'user', 'project', 'started_at', 'completed_at',
+            'submission_count', 'latest_submission_version', 'created_at', 'updated_at'
+        ]
         # Status might be updated by user actions (e.g., starting) or system (submission, assessment)
         # repository_url and live_url are writable by the user.
 
@@ -189,9 +211,15 @@ class UserProjectDetailSerializer(serializers.ModelSerializer):
         user = request.user if request else None
         project = data.get('project') # This will be the Project instance after validate_project_id
 
-        if not self.instance: # Creating a new UserProject
-            if UserProject.objects.filter(user=user, project=project).exists():
+        if not self.instance: # Creating a new UserProject (archived instances don't count)
+            if UserProject.objects.filter(user=user, project=project).exclude(status='archived').exists():
                 raise serializers.ValidationError(_("You have already started this project."))
+        elif self.instance.status == 'archived' and data.get('status', 'archived') != 'archived':
+            # Un-archiving: another active instance may have been started since this one was archived
+            if UserProject.objects.filter(
+                user_id=self.instance.user_id, project_id=self.instance.project_id
+            ).exclude(status='archived').exclude(pk=self.instance.pk).exists():
+                raise serializers.ValidationError(_("You already have an active instance of this project."))
         return data
 
     def create(self, validated_data):
@@ -200,17 +228,37 @@ class UserProjectDetailSerializer(serializers.ModelSerializer):
             validated_data['user'] = self.context['request'].user
         
         # Default status is 'not_started', if user explicitly starts it, status might be 'in_progress'
-        if validated_data.get('status') == 'in_progress':
-            validated_data['started_at'] = timezone.now()
-            
-        return super().create(validated_data)
+        # (UserProject.save() then sets started_at)
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError: # A concurrent request created the instance after validate() ran
+            raise serializers.ValidationError(_("You have already started this project."))
+
+    def update(self, instance, validated_data):
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError: # A concurrent request re-activated another instance after validate() ran
+            raise serializers.ValidationError(_("You already have an active instance of this project."))
 
 
 # --- ProjectSubmission Serializers ---
+class SubmissionArtifactSerializer(serializers.ModelSerializer):
+    """
+    Serializer for SubmissionArtifact model (read-only, derived from submission_artifacts).
+    """
+    class Meta:
+        model = SubmissionArtifact
+        fields = ['kind', 'url', 'title', 'order']
+        read_only_fields = fields
+
+
 class ProjectSubmissionSerializer(serializers.ModelSerializer):
     """
     Serializer for ProjectSubmission model.
     """
+    artifacts = SubmissionArtifactSerializer(many=True, read_only=True) # Prefer over submission_artifacts (deprecated)
     user_project_id = serializers.PrimaryKeyRelatedField(
         queryset=UserProject.objects.all(), source='user_project', write_only=True
     )
@@ -221,10 +269,12 @@ class ProjectSubmissionSerializer(serializers.ModelSerializer):
         model = ProjectSubmission
         fields = [
             'id', 'user_project_id', 'user_project_title', 'user_email',
-            'submitted_at', 'submission_notes', 'submission_artifacts',
-            'submission_version'
+            'submitted_at', 'submission_notes', 'submission_artifacts', 'artifacts',
+            'submission_version', 'is_assessed'
+        ]
+        read_only_fields = [
+            'id', 'submitted_at', 'submission_version', 'is_assessed', 'artifacts', 'user_project_title', 'user_email'
         ]
-        read_only_fields = ['id', 'submitted_at', 'submission_version', 'user_project_title', 'user_email']
 
     def validate_user_project_id(self, value): # value is UserProject instance
         request = self.context.get('request')
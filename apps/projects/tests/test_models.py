@@ -1,13 +1,19 @@
+import time
+import uuid
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.utils.text import slugify
 from decimal import Decimal # Though not directly used in project models, good practice if prices were involved
 
 from apps.projects.models import (
-    ProjectTag, Project, UserProject, ProjectSubmission, ProjectAssessment,
-    PROJECT_DIFFICULTY_CHOICES, USER_PROJECT_STATUS_CHOICES
+    ProjectTag, Project, UserProject, ProjectSubmission, SubmissionArtifact, ProjectAssessment,
+    ProjectCatalogEntry, PROJECT_DIFFICULTY_CHOICES, uuid7, USER_PROJECT_STATUS_CHOICES
 )
 # Ensure settings are configured for tests, especially AUTH_USER_MODEL
 from django.conf import settings
@@ -80,6 +86,19 @@ class ProjectsModelTestDataMixin:
         )
 
 
+class UUID7Tests(TestCase):
+    def test_uuid7_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_uuid7_is_time_ordered(self):
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        self.assertLess(first.hex, second.hex)
+
+
 class ProjectTagModelTests(ProjectsModelTestDataMixin, TestCase):
     def test_project_tag_creation(self):
         self.assertEqual(self.tag_python.name, 'Python')
@@ -95,6 +114,12 @@ class ProjectTagModelTests(ProjectsModelTestDataMixin, TestCase):
         with self.assertRaises(IntegrityError):
             ProjectTag.objects.create(name='Python New', slug='python')
 
+    def test_project_tag_save_without_slug_change_skips_rebuild(self):
+        tag = ProjectTag.objects.get(pk=self.tag_python.pk)
+        tag.name = 'Python 3'
+        with self.assertNumQueries(1): # Just the tag's own UPDATE
+            tag.save()
+
 
 class ProjectModelTests(ProjectsModelTestDataMixin, TestCase):
     def test_project_definition_creation(self):
@@ -105,10 +130,40 @@ class ProjectModelTests(ProjectsModelTestDataMixin, TestCase):
         self.assertIn(self.tag_django, self.project_def1.technologies_used.all())
         self.assertEqual(str(self.project_def1), 'Build a To-Do List API')
 
+    def test_project_tag_slugs_follow_technologies_used(self):
+        self.project_def1.refresh_from_db()
+        self.assertEqual(self.project_def1.tag_slugs, ['api-development', 'django', 'python'])
+
+        self.project_def1.technologies_used.remove(self.tag_django)
+        self.project_def1.refresh_from_db()
+        self.assertEqual(self.project_def1.tag_slugs, ['api-development', 'python'])
+
+        self.tag_python.slug = 'python3'
+        self.tag_python.save()
+        self.tag_api.delete()
+        self.project_def1.refresh_from_db()
+        self.assertEqual(self.project_def1.tag_slugs, ['python3'])
+
     def test_project_slug_uniqueness(self):
         with self.assertRaises(IntegrityError):
             Project.objects.create(title='Another To-Do API', slug='todo-list-api', description='test')
 
+    def test_bulk_ingest_ai_skips_existing_slugs_and_attaches_tags(self):
+        created = Project.bulk_ingest_ai(
+            prompts=['prompt one', 'prompt two'],
+            titles=['Todo List API', 'Weather Dashboard'],
+            descriptions=['Duplicate slug.', 'Show a forecast.'],
+            tags_by_slug={'weather-dashboard': ['Python', 'Data Visualization']},
+        )
+        self.assertEqual([p.slug for p in created], ['weather-dashboard'])
+        project = Project.objects.get(slug='weather-dashboard')
+        self.assertTrue(project.ai_generated)
+        self.assertFalse(project.is_published)
+        self.assertEqual(project.ai_generation_prompt, 'prompt two')
+        self.assertEqual(project.tag_slugs, ['data-visualization', 'python'])
+        self.assertIn(self.tag_python, project.technologies_used.all())
+        self.assertEqual(Project.objects.get(slug='todo-list-api').title, 'Build a To-Do List API')
+
 
 class UserProjectModelTests(ProjectsModelTestDataMixin, TestCase):
     def test_user_project_creation(self):
@@ -119,10 +174,50 @@ class UserProjectModelTests(ProjectsModelTestDataMixin, TestCase):
         expected_str = f"{self.user1.email}'s work on '{self.project_def1.title}' (Not Started)"
         self.assertEqual(str(self.user_project1), expected_str)
 
+    def test_user_project_denormalized_display_fields(self):
+        self.assertEqual(self.user_project1.user_email, self.user1.email)
+        self.assertEqual(self.user_project1.project_title, self.project_def1.title)
+
+        self.project_def1.title = 'Build a Better To-Do List API'
+        self.project_def1.save()
+        self.user_project1.refresh_from_db()
+        self.assertEqual(self.user_project1.project_title, 'Build a Better To-Do List API')
+
+    def test_user_project_backfill_display_fields(self):
+        UserProject.objects.filter(pk=self.user_project1.pk).update(user_email='', project_title='')
+        UserProject.backfill_display_fields()
+        self.user_project1.refresh_from_db()
+        self.assertEqual(self.user_project1.user_email, self.user1.email)
+        self.assertEqual(self.user_project1.project_title, self.project_def1.title)
+
     def test_user_project_uniqueness_user_project_definition(self):
         with self.assertRaises(IntegrityError):
             UserProject.objects.create(user=self.user1, project=self.project_def1)
 
+    def test_user_project_archived_instance_allows_restart(self):
+        self.user_project1.status = 'archived'
+        self.user_project1.save()
+        restarted = UserProject.objects.create(user=self.user1, project=self.project_def1, status='in_progress')
+        self.assertEqual(UserProject.objects.filter(user=self.user1, project=self.project_def1).count(), 2)
+
+        with self.assertRaises(IntegrityError):
+            UserProject.objects.create(user=self.user1, project=self.project_def1)
+
+    def test_user_project_full_clean_checks_active_uniqueness(self):
+        UserProject(user=self.user2, project=self.project_def1).full_clean()
+        UserProject(user=self.user1, project=self.project_def1, status='archived').full_clean()
+        with self.assertRaises(ValidationError):
+            UserProject(user=self.user1, project=self.project_def1, status='in_progress').full_clean()
+
+    def test_user_project_for_listing_avoids_per_row_queries(self):
+        UserProject.objects.create(user=self.user2, project=self.project_def1)
+        with self.assertNumQueries(1):
+            rows = [
+                (str(up), up.user.email, up.project.slug, up.project.get_difficulty_level_display())
+                for up in UserProject.objects.for_listing()
+            ]
+        self.assertEqual(len(rows), 2)
+
     def test_user_project_save_sets_started_at(self):
         self.user_project1.status = 'in_progress'
         self.user_project1.save()
@@ -141,6 +236,12 @@ class UserProjectModelTests(ProjectsModelTestDataMixin, TestCase):
         self.user_project1.save()
         self.assertEqual(self.user_project1.get_status_display(), 'Completed Successfully')
 
+    def test_user_project_save_sets_completed_at(self):
+        self.user_project1.status = 'completed'
+        self.user_project1.save()
+        self.user_project1.refresh_from_db()
+        self.assertIsNotNone(self.user_project1.completed_at)
+
 
 class ProjectSubmissionModelTests(ProjectsModelTestDataMixin, TestCase):
     def setUp(self):
@@ -186,6 +287,102 @@ class ProjectSubmissionModelTests(ProjectsModelTestDataMixin, TestCase):
         )
         self.assertEqual(submission3.submission_version, 3)
 
+    def test_project_submission_updates_user_project_stats(self):
+        ProjectSubmission.objects.create(user_project=self.user_project1)
+        ProjectSubmission.objects.create(user_project=self.user_project1)
+        self.user_project1.refresh_from_db()
+        self.assertEqual(self.user_project1.submission_count, 2)
+        self.assertEqual(self.user_project1.latest_submission_version, 2)
+
+    def test_stale_user_project_save_keeps_submission_stats(self):
+        stale = UserProject.objects.get(pk=self.user_project1.pk)
+        ProjectSubmission.objects.create(user_project=self.user_project1)
+        self.assertEqual(self.user_project1.submission_count, 1) # Copied onto the caller's instance
+
+        stale.live_url = 'https://todo.example.com'
+        stale.save()
+        self.user_project1.refresh_from_db()
+        self.assertEqual(self.user_project1.live_url, 'https://todo.example.com')
+        self.assertEqual((self.user_project1.submission_count, self.user_project1.latest_submission_version), (1, 1))
+
+    def test_project_submission_delete_refreshes_user_project_stats(self):
+        submission1 = ProjectSubmission.objects.create(user_project=self.user_project1)
+        submission2 = ProjectSubmission.objects.create(user_project=self.user_project1)
+        submission2.delete()
+        self.user_project1.refresh_from_db()
+        self.assertEqual(self.user_project1.submission_count, 1)
+        self.assertEqual(self.user_project1.latest_submission_version, 1)
+
+        UserProject.objects.filter(pk=self.user_project1.pk).update(submission_count=0, latest_submission_version=0)
+        UserProject.refresh_submission_stats() # Backfill
+        self.user_project1.refresh_from_db()
+        self.assertEqual(self.user_project1.submission_count, 1)
+        submission1.delete()
+        self.user_project1.refresh_from_db()
+        self.assertEqual((self.user_project1.submission_count, self.user_project1.latest_submission_version), (0, 0))
+
+    def test_project_submission_normalizes_artifacts(self):
+        submission = ProjectSubmission.objects.create(
+            user_project=self.user_project1,
+            submission_artifacts={
+                'repository_url': 'https://github.com/user1/todo-api',
+                'live_demo_url': 'https://todo.example.com',
+                'file_links': ['https://files.example.com/report.pdf'],
+            }
+        )
+        artifacts = list(submission.artifacts.values_list('kind', 'url'))
+        self.assertEqual(artifacts, [
+            ('repo', 'https://github.com/user1/todo-api'),
+            ('live', 'https://todo.example.com'),
+            ('file', 'https://files.example.com/report.pdf'),
+        ])
+        self.assertEqual(submission.artifacts.get(kind='file').title, 'report.pdf')
+
+    def test_project_submission_resyncs_artifacts_on_update(self):
+        submission = ProjectSubmission.objects.create(
+            user_project=self.user_project1,
+            submission_artifacts={'repository_url': 'https://github.com/user1/todo-api'}
+        )
+        submission = ProjectSubmission.objects.get(pk=submission.pk)
+        long_url = 'https://storage.example.com/report.pdf?X-Goog-Signature=' + 'a' * 512
+        submission.submission_artifacts = {'repository_url': 'https://github.com/user1/todo-api-v2', 'file_links': [long_url]}
+        submission.save()
+        self.assertEqual(list(submission.artifacts.values_list('url', flat=True)), [
+            'https://github.com/user1/todo-api-v2', long_url
+        ])
+
+    def test_project_submission_resyncs_artifacts_on_in_place_edit(self):
+        submission = ProjectSubmission.objects.create(
+            user_project=self.user_project1,
+            submission_artifacts={'repository_url': 'https://github.com/user1/todo-api'}
+        )
+        submission = ProjectSubmission.objects.get(pk=submission.pk)
+        submission.submission_artifacts['repository_url'] = 'https://github.com/user1/todo-api-v2'
+        submission.save()
+        self.assertEqual(submission.artifacts.get().url, 'https://github.com/user1/todo-api-v2')
+
+        submission.submission_artifacts['repository_url'] = 'https://github.com/user1/todo-api-v3' # Same instance again
+        submission.save()
+        self.assertEqual(submission.artifacts.get().url, 'https://github.com/user1/todo-api-v3')
+
+    def test_submission_artifact_backfill(self):
+        submission = ProjectSubmission.objects.create(
+            user_project=self.user_project1,
+            submission_artifacts={'repository_url': 'https://github.com/user1/todo-api'}
+        )
+        submission.artifacts.all().delete() # As for a submission saved before the table existed
+        self.assertEqual(SubmissionArtifact.backfill(), 1)
+        self.assertEqual(submission.artifacts.get().url, 'https://github.com/user1/todo-api')
+
+    def test_project_submission_renumber_versions(self):
+        submission1 = ProjectSubmission.objects.create(user_project=self.user_project1)
+        submission2 = ProjectSubmission.objects.create(user_project=self.user_project1)
+        ProjectSubmission.objects.update(submission_version=1) # As left by the old save() logic
+        self.assertEqual(ProjectSubmission.renumber_versions(), 1)
+        submission1.refresh_from_db()
+        submission2.refresh_from_db()
+        self.assertEqual((submission1.submission_version, submission2.submission_version), (1, 2))
+
 
 class ProjectAssessmentModelTests(ProjectsModelTestDataMixin, TestCase):
     def setUp(self):
@@ -208,6 +405,7 @@ class ProjectAssessmentModelTests(ProjectsModelTestDataMixin, TestCase):
             detailed_feedback={'criteria': {'auth': 'passed', 'crud': 'passed'}, 'notes': 'Well done.'}
         )
         self.assertEqual(assessment.submission, self.submission1)
+        self.assertEqual(assessment.user_project, self.user_project1)
         self.assertTrue(assessment.assessed_by_ai)
         self.assertEqual(assessment.score, 85.0)
         self.assertTrue(assessment.passed)
@@ -236,6 +434,45 @@ class ProjectAssessmentModelTests(ProjectsModelTestDataMixin, TestCase):
         self.assertEqual(self.user_project1.status, 'failed')
         self.assertIsNone(self.user_project1.completed_at) # Should not be set if failed
 
+    def test_project_assessment_flags_submission_as_assessed(self):
+        self.assertFalse(self.submission1.is_assessed)
+        assessment = ProjectAssessment.objects.create(submission=self.submission1, score=70.0, passed=True)
+        self.submission1.refresh_from_db()
+        self.assertTrue(self.submission1.is_assessed)
+
+        assessment.delete()
+        self.submission1.refresh_from_db()
+        self.assertFalse(self.submission1.is_assessed)
+
+    def test_project_assessment_bulk_finalize(self):
+        user_project2 = UserProject.objects.create(user=self.user2, project=self.project_def1, status='in_progress')
+        submission2 = ProjectSubmission.objects.create(user_project=user_project2)
+        assessments = ProjectAssessment.objects.bulk_create([
+            ProjectAssessment(submission=self.submission1, score=80.0, passed=True),
+            ProjectAssessment(submission=submission2, score=40.0, passed=False),
+        ])
+        with self.assertNumQueries(8): # 1 lookup, 1 lock + 4 UPDATEs, plus the SAVEPOINT/RELEASE pair of the atomic block
+            ProjectAssessment.bulk_finalize(assessments)
+
+        self.user_project1.refresh_from_db()
+        user_project2.refresh_from_db()
+        self.assertEqual(self.user_project1.status, 'completed')
+        self.assertIsNotNone(self.user_project1.completed_at)
+        self.assertEqual(user_project2.status, 'failed')
+        self.assertIsNone(user_project2.completed_at)
+        self.assertEqual(ProjectSubmission.objects.filter(is_assessed=True).count(), 2)
+        self.assertEqual(user_project2.assessments.get().submission, submission2)
+
+    def test_project_assessment_bulk_finalize_uses_latest_submission(self):
+        submission2 = ProjectSubmission.objects.create(user_project=self.user_project1)
+        assessments = ProjectAssessment.objects.bulk_create([
+            ProjectAssessment(submission=submission2, score=85.0, passed=True),
+            ProjectAssessment(submission=self.submission1, score=40.0, passed=False),
+        ])
+        ProjectAssessment.bulk_finalize(assessments)
+        self.user_project1.refresh_from_db()
+        self.assertEqual(self.user_project1.status, 'completed')
+
     def test_project_assessment_manual_assessor(self):
         assessment = ProjectAssessment.objects.create(
             submission=self.submission1,
@@ -247,6 +484,30 @@ class ProjectAssessmentModelTests(ProjectsModelTestDataMixin, TestCase):
         self.assertFalse(assessment.assessed_by_ai)
         self.assertEqual(assessment.manual_assessor, self.instructor_user)
 
+class ProjectCatalogEntryModelTests(ProjectsModelTestDataMixin, TestCase):
+    def test_refresh_builds_entries_for_published_projects(self):
+        submission = ProjectSubmission.objects.create(user_project=self.user_project1)
+        ProjectAssessment.objects.create(submission=submission, score=80.0, passed=True)
+
+        self.assertEqual(ProjectCatalogEntry.refresh(), 1)
+        entry = ProjectCatalogEntry.objects.get()
+        self.assertEqual(entry.project, self.project_def1)
+        self.assertEqual(entry.slug, 'todo-list-api')
+        self.assertEqual(entry.tag_names, 'API Development, Django, Python')
+        self.assertEqual(entry.attempt_count, 1)
+        self.assertEqual(entry.avg_score, 80.0)
+
+        # Refreshing again replaces, rather than duplicates, the entries
+        self.assertEqual(ProjectCatalogEntry.refresh(), 1)
+        self.assertEqual(ProjectCatalogEntry.objects.count(), 1)
+
+    def test_refresh_project_catalog_command(self):
+        out = StringIO()
+        call_command('refresh_project_catalog', stdout=out)
+        self.assertIn('Refreshed project catalog with 1 entries.', out.getvalue())
+        self.assertEqual(ProjectCatalogEntry.objects.get().project, self.project_def1)
+
+
 # Add more tests for:
 # - Constraints like JSONField schema validation (if enforced outside model, e.g. in serializers).
 # - More complex interactions between model save methods if any.
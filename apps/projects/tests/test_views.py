@@ -8,7 +8,7 @@ from rest_framework.test import APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.projects.models import (
-    ProjectTag, Project, UserProject, ProjectSubmission, ProjectAssessment
+    ProjectTag, Project, UserProject, ProjectSubmission, ProjectAssessment, ProjectCatalogEntry
 )
 # Import serializers to compare response data (optional, can also check specific fields)
 from apps.projects.serializers import (
@@ -138,6 +138,61 @@ class ProjectViewSetTests(ProjectsViewTestDataMixin, APITestCase):
         self.assertIn(self.project_def3_other_instructor.slug, slugs_in_response)
         self.assertNotIn(self.project_def2_unpublished.slug, slugs_in_response)
 
+    def test_list_project_definitions_filter_by_learning_outcome(self):
+        self.project_def1_published.learning_outcomes = ['API Integration', 'Testing']
+        self.project_def1_published.save(update_fields=['learning_outcomes'])
+        url = reverse('projects:project-definition-list')
+        response = self.client.get(url, {'learning_outcome': 'API Integration'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        slugs_in_response = [item['slug'] for item in response.data['results']]
+        self.assertEqual(slugs_in_response, [self.project_def1_published.slug])
+
+    def test_list_project_definitions_filter_by_learning_outcome_is_list_only(self):
+        self.project_def1_published.learning_outcomes = {'skills': ['API Integration']}
+        self.project_def1_published.save(update_fields=['learning_outcomes'])
+        url = reverse('projects:project-definition-list')
+        response = self.client.get(url, {'learning_outcome': 'API Integration'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+
+    def test_list_project_definitions_filter_by_tags(self):
+        url = reverse('projects:project-definition-list')
+        response = self.client.get(url, {'tags': self.tag_python.slug})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        slugs_in_response = [item['slug'] for item in response.data['results']]
+        self.assertEqual(slugs_in_response, [self.project_def1_published.slug])
+
+    def test_catalog_lists_published_projects_anonymous(self):
+        ProjectCatalogEntry.refresh()
+        url = reverse('projects:project-definition-catalog')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        slugs_in_response = [item['slug'] for item in response.data['results']]
+        self.assertEqual(slugs_in_response, [self.project_def3_other_instructor.slug, self.project_def1_published.slug])
+        self.assertNotIn(self.project_def2_unpublished.slug, slugs_in_response)
+
+        response = self.client.get(url, {'difficulty_level': 'beginner'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['slug'] for item in response.data['results']], [self.project_def3_other_instructor.slug])
+
+    def test_catalog_is_paginated(self):
+        Project.objects.bulk_create([
+            Project(title=f'Catalog Project {i:02d}', slug=f'catalog-project-{i:02d}', description='test', is_published=True)
+            for i in range(25)
+        ])
+        ProjectCatalogEntry.refresh()
+        url = reverse('projects:project-definition-catalog')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 27)
+        self.assertIsNotNone(response.data['next'])
+        self.assertLess(len(response.data['results']), 27)
+
+        response = self.client.get(url, {'page': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(response.data['previous'])
+
     def test_retrieve_published_project_definition_anonymous(self):
         url = reverse('projects:project-definition-detail', kwargs={'slug': self.project_def1_published.slug})
         response = self.client.get(url)
@@ -285,6 +340,17 @@ class UserProjectViewSetTests(ProjectsViewTestDataMixin, APITestCase):
         self.assertEqual(up_not_started.status, "in_progress")
         self.assertIsNotNone(up_not_started.started_at) # Check if perform_update logic sets it
 
+    def test_unarchive_user_project_with_active_instance_fails(self):
+        archived = UserProject.objects.create(user=self.user1, project=self.project_def3_other_instructor, status='archived')
+        UserProject.objects.create(user=self.user1, project=self.project_def3_other_instructor, status='in_progress')
+
+        self.authenticate_client_with_jwt(self.user1)
+        url = reverse('projects:user-project-detail', kwargs={'pk': archived.pk})
+        response = self.client.patch(url, {"status": "in_progress"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        archived.refresh_from_db()
+        self.assertEqual(archived.status, 'archived')
+
 
 class ProjectSubmissionViewSetTests(ProjectsViewTestDataMixin, APITestCase):
     def setUp(self):
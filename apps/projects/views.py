@@ -1,6 +1,5 @@
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
-from django.utils import timezone
 from django.db.models import Q
 
 from rest_framework import viewsets, status, generics
@@ -13,11 +12,11 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 
 from .models import (
-    ProjectTag, Project, UserProject, ProjectSubmission, ProjectAssessment
+    ProjectTag, Project, UserProject, ProjectSubmission, ProjectAssessment, ProjectCatalogEntry
 )
 from .serializers import (
     ProjectTagSerializer,
-    ProjectListSerializer, ProjectDetailSerializer,
+    ProjectListSerializer, ProjectDetailSerializer, ProjectCatalogEntrySerializer,
     UserProjectListSerializer, UserProjectDetailSerializer,
     ProjectSubmissionSerializer,
     ProjectAssessmentSerializer
@@ -47,6 +46,8 @@ class ProjectViewSet(viewsets.ModelViewSet):
     API endpoint for managing project definitions.
     - List/Retrieve: Published projects are visible to all. Unpublished only to creator/admin.
     - Create/Update/Delete: Restricted to project creator or admin.
+    - List filters: ?tags=a,b (all tag slugs), ?learning_outcome= and ?prerequisite= (exact entry;
+      only matches projects storing those fields as a plain list, e.g. ["API Integration"]).
     """
     queryset = Project.objects.all() # Base queryset
     permission_classes = [IsProjectCreatorOrAdminOrReadOnly] # Handles most cases
@@ -68,28 +69,57 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
+        if self.action == 'list': # Summary columns only, creator joined, tags prefetched
+            queryset = Project.objects.for_listing()
+        else:
+            queryset = Project.objects.select_related('created_by').prefetch_related('technologies_used')
         if user.is_authenticated and user.is_staff:
-            return Project.objects.all().select_related('created_by').prefetch_related('technologies_used')
+            return queryset
         
         # For list view, show published OR user's own unpublished projects
         if self.action == 'list' and user.is_authenticated:
-            return Project.objects.filter(
-                Q(is_published=True) | Q(created_by=user)
-            ).select_related('created_by').prefetch_related('technologies_used').distinct()
+            return queryset.filter(Q(is_published=True) | Q(created_by=user)).distinct()
         
-        # For retrieve, permissions will handle unpublished. Default to published for anonymous.
-        if self.action == 'retrieve' or not user.is_authenticated:
-             return Project.objects.filter(is_published=True).select_related('created_by').prefetch_related('technologies_used')
-
-        # Default for authenticated users (e.g. if they are trying to access a direct non-list/retrieve action)
-        return Project.objects.filter(is_published=True).select_related('created_by').prefetch_related('technologies_used')
-
+        # For retrieve, permissions will handle unpublished. Default to published for anonymous
+        # and for any other action by authenticated users.
+        return queryset.filter(is_published=True)
+
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # Catalog filtering by skill, e.g. ?learning_outcome=API Integration (JSON array containment).
+        # List-shaped values only: object-shaped ones such as {'skills': [...]} are not matched.
+        learning_outcome = self.request.query_params.get('learning_outcome')
+        if learning_outcome:
+            queryset = queryset.filter(learning_outcomes__contains=[learning_outcome])
+        prerequisite = self.request.query_params.get('prerequisite')
+        if prerequisite:
+            queryset = queryset.filter(prerequisites__contains=[prerequisite])
+        # Projects having all given tags, e.g. ?tags=python,rest-api (indexed lookup on the denormalized slugs)
+        tags = [slug.strip() for slug in self.request.query_params.get('tags', '').split(',') if slug.strip()]
+        if tags:
+            queryset = queryset.filter(tag_slugs__contains=tags)
+        return queryset
 
     def perform_create(self, serializer):
         # If created_by is not in serializer (e.g. not admin setting it), set to current user.
         # Serializer's create method already handles this logic.
         serializer.save() # created_by is handled in serializer context
 
+    @action(detail=False, methods=['get'], permission_classes=[AllowAny], url_path='catalog', url_name='catalog')
+    def catalog(self, request):
+        """
+        Lists published projects from the precomputed catalog (refreshed periodically, may lag slightly).
+        """
+        queryset = ProjectCatalogEntry.objects.all()
+        difficulty_level = request.query_params.get('difficulty_level')
+        if difficulty_level:
+            queryset = queryset.filter(difficulty_level=difficulty_level)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(ProjectCatalogEntrySerializer(page, many=True).data)
+        return Response(ProjectCatalogEntrySerializer(queryset, many=True).data)
+
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated], url_path='start-project', url_name='start-project')
     def start_project(self, request, slug=None):
         """
@@ -122,10 +152,14 @@ class UserProjectViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
+        if self.action == 'list':
+            queryset = UserProject.objects.for_listing()
+        else: # The detail serializer nests the full project definition
+            queryset = UserProject.objects.select_related('user', 'project__created_by').prefetch_related('project__technologies_used')
         if user.is_staff: # Admins see all
-            return UserProject.objects.all().select_related('user', 'project__created_by').prefetch_related('project__technologies_used')
+            return queryset
         # Regular users see only their own projects
-        return UserProject.objects.filter(user=user).select_related('user', 'project__created_by').prefetch_related('project__technologies_used')
+        return queryset.filter(user=user)
 
     def get_serializer_class(self):
         if self.action == 'list':
@@ -142,11 +176,8 @@ class UserProjectViewSet(viewsets.ModelViewSet):
         # User can update fields like repository_url, live_url, or status (e.g., to 'in_progress')
         # Ensure they can't change the 'user' or 'project' fields after creation.
         # Serializer read_only_fields should handle this.
-        # If status is changed to 'in_progress', model's save method handles started_at.
-        user_project = serializer.save()
-        if 'status' in serializer.validated_data and serializer.validated_data['status'] == 'in_progress' and not user_project.started_at:
-            user_project.started_at = timezone.now()
-            user_project.save(update_fields=['started_at'])
+        # If status is changed to 'in_progress', model's save method sets started_at in the same UPDATE.
+        serializer.save()
 
 
 class ProjectSubmissionViewSet(viewsets.ModelViewSet):
@@ -165,15 +196,12 @@ class ProjectSubmissionViewSet(viewsets.ModelViewSet):
         user_project_pk = self.kwargs.get('user_project_pk')
 
         if user.is_staff: # Admins see all (or all for a specific user_project if nested)
-            if user_project_pk:
-                return ProjectSubmission.objects.filter(user_project_id=user_project_pk).select_related('user_project__user', 'user_project__project')
-            return ProjectSubmission.objects.all().select_related('user_project__user', 'user_project__project')
-        
-        # Regular users see only their own submissions
-        base_qs = ProjectSubmission.objects.filter(user_project__user=user)
+            base_qs = ProjectSubmission.objects.all()
+        else: # Regular users see only their own submissions
+            base_qs = ProjectSubmission.objects.filter(user_project__user=user)
         if user_project_pk:
-            return base_qs.filter(user_project_id=user_project_pk).select_related('user_project__user', 'user_project__project')
-        return base_qs.select_related('user_project__user', 'user_project__project')
+            base_qs = base_qs.filter(user_project_id=user_project_pk)
+        return base_qs.for_listing()
 
     def perform_create(self, serializer):
         user_project_id = serializer.validated_data['user_project'].id # From source='user_project'